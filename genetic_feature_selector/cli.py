@@ -82,7 +82,14 @@ from .visualization import plot_all_metrics
     type=int,
     help="Número de mejores individuos a mantener en cada generación",
 )
-def main(input_file, target_col, config_file, output_dir, pop_size, generations, cv, crossover_rate, mutation_rate, elite_size):
+@click.option(
+    "--warm-start",
+    "warm_start",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Directorio de resultados de una ejecución anterior para inicializar la población",
+)
+def main(input_file, target_col, config_file, output_dir, pop_size, generations, cv, crossover_rate, mutation_rate, elite_size, warm_start):
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -101,7 +108,7 @@ def main(input_file, target_col, config_file, output_dir, pop_size, generations,
         estimator=pipeline,
         elite_size=elite_size,
     )
-    selected_indices, best_score = fs.fit(X, y, feature_names=feature_names)
+    selected_indices, best_score = fs.fit(X, y, feature_names=feature_names, warm_start=warm_start)
     
     # Get selected features
     selected_features = binary_to_features(
@@ -114,13 +121,15 @@ def main(input_file, target_col, config_file, output_dir, pop_size, generations,
         'selected_features': selected_features,
         'selected_indices': selected_indices,
         'best_score': best_score,
+        'feature_names': feature_names,
         'parameters': {
             'population_size': pop_size,
             'generations': generations,
             'cv': cv,
             'crossover_rate': crossover_rate,
             'mutation_rate': mutation_rate,
-            'elite_size': elite_size
+            'elite_size': elite_size,
+            'warm_start': warm_start
         }
     }
     
@@ -35,6 +35,7 @@ class GeneticAlgorithm:
         mutation_rate=0.01,
         fitness_func=None,
         elite_size=2,  # Number of best individuals to keep
+        initial_genomes=None,  # Genomes to seed the population with (warm start)
     ):
         self.genome_length = genome_length
         self.population_size = population_size
@@ -43,12 +44,29 @@ class GeneticAlgorithm:
         self.mutation_rate = mutation_rate
         self.fitness_func = fitness_func
         self.elite_size = elite_size
+        self.initial_genomes = initial_genomes or []
         self.population = []
 
     def _initialize_population(self):
         """Initialize population with a mix of strategies"""
         self.population = []
-        
+
+        # 0. Genomes carried over from a previous run (warm start)
+        seen = set()
+        for genome in self.initial_genomes:
+            if len(self.population) >= self.population_size:
+                break
+            if len(genome) != self.genome_length or tuple(genome) in seen:
+                continue
+            seen.add(tuple(genome))
+            self.population.append(Individual(list(genome)))
+        if self.population:
+            # Warm-started populations only need random individuals for diversity
+            while len(self.population) < self.population_size:
+                genome = [random.randint(0, 1) for _ in range(self.genome_length)]
+                self.population.append(Individual(genome))
+            return
+
         # 1. All features selected
         self.population.append(Individual([1] * self.genome_length))
         
@@ -101,7 +119,8 @@ class GeneticAlgorithm:
         # Initialize history
         history = {
             'best_genomes': [],
-            'best_fitnesses': []
+            'best_fitnesses': [],
+            'final_population': []
         }
 
         for _ in tqdm(range(self.generations), desc="Genetic Algorithm Progress"):
@@ -142,5 +161,8 @@ class GeneticAlgorithm:
             history['best_genomes'].append(best.genome)
             history['best_fitnesses'].append(best.fitness)
 
+        # Keep the final population so a later run can warm-start from it
+        history['final_population'] = [ind.genome for ind in self.population]
+
         best = max(self.population, key=lambda ind: ind.fitness)
         return best.genome, best.fitness, history
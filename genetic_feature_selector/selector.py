@@ -3,6 +3,7 @@ import numpy as np
 
 from .ga import GeneticAlgorithm
 from .fitness import evaluate_fitness
+from .utils import load_warm_start
 
 class FeatureSelector:
     def __init__(
@@ -31,9 +32,16 @@ class FeatureSelector:
         X: np.ndarray,
         y: np.ndarray,
         feature_names: List[str] = None,
+        warm_start: str = None,
     ) -> Tuple[List[int], float]:
         n_features = X.shape[1]
 
+        initial_genomes = None
+        if warm_start is not None:
+            if feature_names is None:
+                feature_names = [f"Feature {i+1}" for i in range(n_features)]
+            initial_genomes = load_warm_start(warm_start, feature_names)
+
         def fitness_wrapper(genome):
             return evaluate_fitness(
                 genome,
@@ -52,6 +60,7 @@ class FeatureSelector:
             mutation_rate=self.mutation_rate,
             fitness_func=fitness_wrapper,
             elite_size=self.elite_size,
+            initial_genomes=initial_genomes,
         )
 
         best_genome, best_score, history = ga.run()
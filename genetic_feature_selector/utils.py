@@ -5,6 +5,8 @@ from typing import Tuple, List, Dict, Any
 from sklearn.pipeline import Pipeline
 from sklearn.base import BaseEstimator
 import importlib
+import json
+from pathlib import Path
 
 def load_data(file_path: str, target_col: str) -> Tuple[pd.DataFrame, pd.Series, List[str]]:
     """Load data from CSV file and return features, target and feature names."""
@@ -61,3 +63,57 @@ def load_pipeline_config(config_path: str) -> Pipeline:
         pipeline_steps.append((step['name'], estimator))
     
     return Pipeline(pipeline_steps)
+
+def remap_genome(genome: List[int], old_feature_names: List[str], new_feature_names: List[str]) -> List[int]:
+    """Map a genome onto a new feature list. Features absent before start unselected."""
+    selected = {name for name, gene in zip(old_feature_names, genome) if gene == 1}
+    return [1 if name in selected else 0 for name in new_feature_names]
+
+def load_warm_start(output_dir: str, feature_names: List[str]) -> List[List[int]]:
+    """
+    Load seed genomes from a previous run's output directory.
+
+    Genomes are read from 'results.json' (the selected features) and
+    'history.json' (the final population and the best genome of each
+    generation, most recent first), and are remapped by name onto
+    feature_names so added or removed columns are handled.
+
+    Returns:
+        List of genomes, best first, without duplicates
+    """
+    output_path = Path(output_dir)
+    with open(output_path / 'results.json', 'r') as f:
+        results = json.load(f)
+
+    history = {}
+    if (output_path / 'history.json').exists():
+        with open(output_path / 'history.json', 'r') as f:
+            history = json.load(f)
+
+    old_feature_names = results.get('feature_names')
+    if old_feature_names is None and 'selected_features' not in results:
+        raise ValueError("results.json must contain 'feature_names' or 'selected_features'")
+
+    genomes = []
+    if old_feature_names is None:
+        # Older results only record the selected features by name
+        genomes.append([1 if name in results['selected_features'] else 0 for name in feature_names])
+    else:
+        old_genomes = history.get('final_population', []) + history.get('best_genomes', [])[::-1]
+        for genome in old_genomes:
+            if len(genome) != len(old_feature_names):
+                raise ValueError("history.json genomes do not match the feature names in results.json")
+        selected_indices = set(results.get('selected_indices', []))
+        best_genome = [1 if i in selected_indices else 0 for i in range(len(old_feature_names))]
+        for genome in [best_genome] + old_genomes:
+            genomes.append(remap_genome(genome, old_feature_names, feature_names))
+
+    # Drop duplicates and empty genomes, keeping the first (best) occurrence
+    unique_genomes = []
+    seen = set()
+    for genome in genomes:
+        if sum(genome) == 0 or tuple(genome) in seen:
+            continue
+        seen.add(tuple(genome))
+        unique_genomes.append(genome)
+    return unique_genomes